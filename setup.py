@@ -60,8 +60,8 @@ def create_directories():
 def check_python_version():
     """Check if Python version is compatible."""
     version = sys.version_info
-    if version.major < 3 or (version.major == 3 and version.minor < 8):
-        print("✗ Python 3.8 or higher is required")
+    if version.major < 3 or (version.major == 3 and version.minor < 10):
+        print("✗ Python 3.10 or higher is required")
         return False
     
     print(f"✓ Python {version.major}.{version.minor}.{version.micro} is compatible")
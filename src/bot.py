@@ -3,19 +3,53 @@ Main bot orchestrator for NVSTWZ autonomous investment bot.
 """
 import asyncio
 import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from decimal import Decimal
+from typing import List, Dict, Optional, Tuple
 import signal
 import sys
+import numpy as np
 
 from .config import config
-from .models import BotStatus, Portfolio, Trade, Position, TradingSignal
+from .models import BotStatus, Portfolio, Trade, Position, TradingSignal, MarketData, OrderType, OrderStatus
 from .market_data import MarketDataEngine
 from .strategy import StrategyEngine
+from .risk_kernels import compute_triggers
 from .utils.logger import get_logger
+from .utils.money import ZERO, to_decimal
 
 logger = get_logger(__name__)
 
+# Risk management constants
+STOP_LOSS_MULTIPLIER = Decimal("0.98")  # Close at a 2% loss
+PROFIT_TARGET_MULTIPLIER = Decimal("1.05")  # Close at a 5% gain
+POSITION_SIZE_PCT = Decimal("0.2")  # Use 20% of available capital per position
+MIN_CASH_PCT = Decimal("0.1")  # Keep at least 10% of capital available
+MAX_TOTAL_LOSS_PCT = Decimal("0.5")  # 50% total loss limit
+
+# Float copies for vectorized trigger screening in _monitor_positions
+_STOP_LOSS_FLOAT = float(STOP_LOSS_MULTIPLIER)
+_PROFIT_TARGET_FLOAT = float(PROFIT_TARGET_MULTIPLIER)
+_TRIGGER_TOLERANCE = 1e-9
+
+# Trading loop cadences (seconds)
+QUOTE_INTERVAL = 30  # Reprice held positions
+SIGNAL_INTERVAL = 300  # 5-minute signal runs to be very gentle on Yahoo Finance
+RISK_LIMIT_PAUSE = 300  # Pause trading after a risk limit breach
+ERROR_BACKOFF = 60  # Wait after a signal task error or before reconnecting quotes
+STATUS_LOG_EVERY = 5  # Log bot status on every 5th risk tick
+
+# Only the most recent errors/warnings are kept for status reporting
+MAX_STATUS_MESSAGES = 50
+
+def _make_position_sizer(fraction: Decimal):
+    """Build a whole-share sizing function bound to a fixed capital fraction."""
+    def size_position(available_capital: Decimal, price: float) -> int:
+        return int(available_capital * fraction / to_decimal(price))
+    
+    return size_position
+
 class NVSTWZBot:
     """Main autonomous investment bot."""
     
@@ -24,20 +58,31 @@ class NVSTWZBot:
         self.market_data = None
         self.strategy = None
         self.portfolio = None
-        self.current_positions = []
-        self.daily_pnl = 0.0
-        self.total_pnl = 0.0
-        self.initial_capital = config.trading.initial_capital
+        self.daily_pnl = ZERO
+        self.total_pnl = ZERO
+        self.initial_capital = to_decimal(config.trading.initial_capital)
         self.current_capital = self.initial_capital
+        
+        # Risk limits derived from config, cached for the trading loop
+        self._daily_loss_limit = -self.initial_capital * to_decimal(config.trading.max_daily_loss)
+        self._total_loss_limit = -self.initial_capital * MAX_TOTAL_LOSS_PCT
+        self._size_position = _make_position_sizer(POSITION_SIZE_PCT)
         self.daily_trades = 0
         self.last_heartbeat = datetime.now()
-        self.errors = []
-        self.warnings = []
+        self.errors = deque(maxlen=MAX_STATUS_MESSAGES)
+        self.warnings = deque(maxlen=MAX_STATUS_MESSAGES)
         
         # Trading state
         self.active_trades = []
         self.pending_orders = []
         
+        # Trading loop tasks
+        self._tasks = []
+        self._quote_queue = None
+        self._order_queue = None
+        self._risk_ticks = 0
+        self._stop_task = None
+        
         # Performance tracking
         self.daily_start_value = self.initial_capital
         self.last_reset_date = datetime.now().date()
@@ -50,11 +95,6 @@ class NVSTWZBot:
             # Initialize components
             await self._initialize_components()
             
-            # Validate configuration
-            if not config.validate():
-                logger.error("Configuration validation failed")
-                return False
-            
             # Set up signal handlers
             self._setup_signal_handlers()
             
@@ -64,6 +104,10 @@ class NVSTWZBot:
             
             await self._main_loop()
             
+            # Let a signal-triggered shutdown finish before returning
+            if self._stop_task:
+                await self._stop_task
+            
         except Exception as e:
             logger.error(f"Error starting bot: {e}")
             self.errors.append(str(e))
@@ -74,10 +118,18 @@ class NVSTWZBot:
         logger.info("Stopping NVSTWZ Bot...")
         self.is_running = False
         
+        # Stop the trading loop tasks so no order lands after positions are closed
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        
         # Close any open positions if needed
         await self._close_all_positions()
         
         logger.info("Bot stopped successfully")
+        
+        # Flush enqueued log messages
+        await logger.complete()
     
     async def _initialize_components(self):
         """Initialize all bot components."""
@@ -92,11 +144,11 @@ class NVSTWZBot:
             self.portfolio = Portfolio(
                 total_value=self.initial_capital,
                 cash_balance=self.initial_capital,
-                invested_amount=0.0,
-                daily_pnl=0.0,
-                total_pnl=0.0,
-                daily_return=0.0,
-                total_return=0.0,
+                invested_amount=ZERO,
+                daily_pnl=ZERO,
+                total_pnl=ZERO,
+                daily_return=ZERO,
+                total_return=ZERO,
                 last_updated=datetime.now()
             )
             
@@ -108,96 +160,192 @@ class NVSTWZBot:
     
     def _setup_signal_handlers(self):
         """Set up signal handlers for graceful shutdown."""
-        def signal_handler(signum, frame):
-            logger.info(f"Received signal {signum}, shutting down gracefully...")
-            asyncio.create_task(self.stop())
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, self._handle_shutdown_signal, signum)
+    
+    def _handle_shutdown_signal(self, signum: int):
+        """Schedule a graceful shutdown from an event loop signal callback."""
+        if self._stop_task:
+            return
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        logger.info(f"Received signal {signum}, shutting down gracefully...")
+        self._stop_task = asyncio.create_task(self.stop())
     
     async def _main_loop(self):
-        """Main trading loop."""
+        """Main trading loop - runs the quote, risk and signal tasks concurrently."""
         logger.info("Entering main trading loop...")
         
+        # Latest quotes only - a slow risk task never works through a backlog
+        self._quote_queue = asyncio.Queue(maxsize=1)
+        self._order_queue = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._quote_task()),
+            asyncio.create_task(self._risk_task()),
+            asyncio.create_task(self._signal_task()),
+            # A single worker - each batch is sized against the cash the previous one left
+            asyncio.create_task(self._order_worker())
+        ]
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+    
+    async def _quote_task(self):
+        """Stream quotes for held positions and publish them to the risk task."""
         while self.is_running:
             try:
-                # Update daily counters
-                self._reset_daily_counters()
+                async for quotes in self.market_data.stream_prices(self.portfolio.positions.keys(), QUOTE_INTERVAL):
+                    if not self.is_running:
+                        break
+                    
+                    # Replace any quotes the risk task has not picked up yet
+                    if self._quote_queue.full():
+                        self._quote_queue.get_nowait()
+                    self._quote_queue.put_nowait(quotes)
                 
-                # Market status check removed - using simplified approach
+            except Exception as e:
+                logger.error(f"Quote stream failed, reconnecting: {e}")
+                self.errors.append(str(e))
+                await asyncio.sleep(ERROR_BACKOFF)
+    
+    async def _risk_task(self):
+        """Reprice the portfolio and check stops/targets as quotes arrive."""
+        while self.is_running:
+            quotes = await self._quote_queue.get()
+            try:
+                now = datetime.now()
+                
+                # Update daily counters
+                self._reset_daily_counters(now)
                 
                 # Update portfolio
-                await self._update_portfolio()
+                self._update_portfolio(quotes, now)
+                
+                # Monitor existing positions
+                await self._monitor_positions(quotes, now)
+                
+                self.last_heartbeat = now
+                
+                # Log status every few ticks
+                if self._risk_ticks % STATUS_LOG_EVERY == 0:
+                    self._log_status()
+                self._risk_ticks += 1
+                
+            except Exception as e:
+                logger.error(f"Error in risk task: {e}")
+                self.errors.append(str(e))
+    
+    async def _signal_task(self):
+        """Generate and execute trading signals on a timer."""
+        while self.is_running:
+            try:
+                now = datetime.now()
+                
+                # Update daily counters
+                self._reset_daily_counters(now)
                 
                 # Check risk limits
                 if not self._check_risk_limits():
                     logger.warning("Risk limits exceeded, pausing trading")
-                    await asyncio.sleep(300)  # Wait 5 minutes
+                    await asyncio.sleep(RISK_LIMIT_PAUSE)
                     continue
                 
                 # Generate trading signals
-                signals = await self.strategy.generate_signals(self.current_positions)
+                signals = await self.strategy.generate_signals(self.portfolio.positions.keys())
                 
-                # Execute trades
+                # Hand signals to the order worker
                 for signal in signals:
-                    if await self._execute_signal(signal):
-                        self.daily_trades += 1
-                        self.strategy.update_trade_count()
-                
-                # Monitor existing positions
-                await self._monitor_positions()
-                
-                # Log status
-                await self._log_status()
+                    self._order_queue.put_nowait(signal)
                 
                 # Wait before next iteration - longer for testing
-                await asyncio.sleep(300)  # 5-minute intervals to be very gentle on Yahoo Finance
+                await asyncio.sleep(SIGNAL_INTERVAL)
                 
             except Exception as e:
-                logger.error(f"Error in main loop: {e}")
+                logger.error(f"Error in signal task: {e}")
                 self.errors.append(str(e))
-                await asyncio.sleep(60)  # Wait 1 minute on error
+                await asyncio.sleep(ERROR_BACKOFF)
     
-    async def _execute_signal(self, signal: TradingSignal) -> bool:
-        """Execute a trading signal."""
-        try:
-            # Validate signal
-            if not await self.strategy.validate_signal(signal):
-                logger.info(f"Signal validation failed for {signal.symbol}")
-                return False
+    async def _order_worker(self):
+        """Execute queued signals, batching everything waiting into one order request."""
+        while True:
+            batch = [await self._order_queue.get()]
+            while not self._order_queue.empty():
+                batch.append(self._order_queue.get_nowait())
+            
+            try:
+                executed = await self._execute_signals(batch, datetime.now())
+                if executed:
+                    self.daily_trades += executed
+                    self.strategy.update_trade_count(executed)
+                
+            except Exception as e:
+                logger.error(f"Error in order worker: {e}")
+                self.errors.append(str(e))
+            finally:
+                for _ in batch:
+                    self._order_queue.task_done()
+    
+    async def _execute_signals(self, signals: List[TradingSignal], now: datetime) -> int:
+        """Execute trading signals as a single batch of orders."""
+        trades = []
+        
+        # Validate all signals against one batch of quotes
+        valid = await self.strategy.validate_signals(signals)
+        available_cash = self.portfolio.cash_balance
+        
+        for signal, is_valid in zip(signals, valid):
+            if not is_valid:
+                logger.info("Signal validation failed for {}", signal.symbol)
+                continue
             
+            trade = self._prepare_trade(signal, available_cash, now)
+            if trade:
+                trades.append(trade)
+                if trade.order_type == OrderType.BUY:
+                    available_cash -= trade.quantity * trade.price
+        
+        if not trades:
+            return 0
+        
+        filled = await self._execute_trades(trades)
+        for trade in filled:
+            logger.info("Executed {} order for {}: {} shares", trade.order_type.value, trade.symbol, trade.quantity)
+            self.active_trades.append(trade)
+        
+        return len(filled)
+    
+    def _prepare_trade(self, signal: TradingSignal, available_cash: Decimal, now: datetime) -> Optional[Trade]:
+        """Size a validated trading signal, returning the trade to submit."""
+        try:
             # Check if we have enough capital
-            if not self._check_capital_availability(signal):
-                logger.info(f"Insufficient capital for {signal.symbol}")
-                return False
+            if not self._check_capital_availability(available_cash):
+                logger.info("Insufficient capital for {}", signal.symbol)
+                return None
             
             # Calculate position size
-            position_size = self._calculate_position_size(signal)
+            position_size = self._calculate_position_size(signal, available_cash)
             
-            # Create trade
-            trade = Trade(
+            return Trade(
                 symbol=signal.symbol,
                 order_type=signal.signal_type,
                 quantity=position_size,
                 price=signal.price_target,  # Use target price as estimate
-                timestamp=datetime.now(),
+                timestamp=now,
                 notes=signal.reasoning
             )
-            
-            # Simulate trade execution (replace with actual Fidelity API call)
-            success = await self._execute_trade(trade)
-            
-            if success:
-                logger.info(f"Executed {signal.signal_type.value} order for {signal.symbol}: {position_size} shares")
-                self.active_trades.append(trade)
-                return True
-            else:
-                logger.warning(f"Trade execution failed for {signal.symbol}")
-                return False
                 
         except Exception as e:
-            logger.error(f"Error executing signal for {signal.symbol}: {e}")
-            return False
+            logger.error(f"Error preparing trade for {signal.symbol}: {e}")
+            return None
+    
+    async def _execute_trades(self, trades: List[Trade]) -> List[Trade]:
+        """Fill a batch of trades one by one (simulated), returning the filled trades."""
+        filled = []
+        for trade in trades:
+            if await self._execute_trade(trade):
+                filled.append(trade)
+            else:
+                logger.warning("Trade execution failed for {}", trade.symbol)
+        
+        return filled
     
     async def _execute_trade(self, trade: Trade) -> bool:
         """Execute a trade (placeholder for Fidelity API integration)."""
@@ -213,18 +361,25 @@ class NVSTWZBot:
                     self.portfolio.invested_amount += cost
                     
                     # Add to positions
-                    position = Position(
-                        symbol=trade.symbol,
-                        quantity=trade.quantity,
-                        average_price=trade.price,
-                        current_price=trade.price,
-                        market_value=cost,
-                        unrealized_pnl=0.0,
-                        realized_pnl=0.0,
-                        last_updated=datetime.now()
-                    )
-                    self.portfolio.positions.append(position)
-                    self.current_positions.append(trade.symbol)
+                    position = self.portfolio.positions.get(trade.symbol)
+                    if position:
+                        quantity = position.quantity + trade.quantity
+                        if quantity:
+                            position.average_price = (position.average_price * position.quantity + cost) / quantity
+                        position.quantity = quantity
+                        position.market_value += cost
+                        position.last_updated = trade.timestamp
+                    else:
+                        self.portfolio.positions[trade.symbol] = Position(
+                            symbol=trade.symbol,
+                            quantity=trade.quantity,
+                            average_price=trade.price,
+                            current_price=trade.price,
+                            market_value=cost,
+                            unrealized_pnl=ZERO,
+                            realized_pnl=ZERO,
+                            last_updated=trade.timestamp
+                        )
                     
                     trade.status = "FILLED"
                     return True
@@ -232,121 +387,123 @@ class NVSTWZBot:
                     return False
             else:  # SELL
                 # Find position to sell
-                for position in self.portfolio.positions:
-                    if position.symbol == trade.symbol:
-                        if position.quantity >= trade.quantity:
-                            proceeds = trade.quantity * trade.price
-                            self.portfolio.cash_balance += proceeds
-                            self.portfolio.invested_amount -= proceeds
-                            
-                            # Update position
-                            position.quantity -= trade.quantity
-                            if position.quantity == 0:
-                                self.portfolio.positions.remove(position)
-                                self.current_positions.remove(trade.symbol)
-                            
-                            trade.status = "FILLED"
-                            return True
-                        else:
-                            return False
+                position = self.portfolio.positions.get(trade.symbol)
+                if not position or position.quantity < trade.quantity:
+                    return False
                 
-                return False
+                proceeds = trade.quantity * trade.price
+                self.portfolio.cash_balance += proceeds
+                self.portfolio.invested_amount -= proceeds
+                
+                # Update position
+                position.quantity -= trade.quantity
+                if position.quantity == 0:
+                    del self.portfolio.positions[trade.symbol]
+                
+                trade.status = "FILLED"
+                return True
                 
         except Exception as e:
             logger.error(f"Error executing trade: {e}")
             return False
     
-    def _check_capital_availability(self, signal: TradingSignal) -> bool:
+    def _check_capital_availability(self, available_cash: Decimal) -> bool:
         """Check if we have enough capital for the trade."""
         # Simple check - ensure we have at least 10% of capital available
-        min_capital = self.current_capital * 0.1
-        return self.portfolio.cash_balance >= min_capital
+        min_capital = self.current_capital * MIN_CASH_PCT
+        return available_cash >= min_capital
     
-    def _calculate_position_size(self, signal: TradingSignal) -> float:
+    def _calculate_position_size(self, signal: TradingSignal, available_capital: Decimal) -> int:
         """Calculate position size based on risk management rules."""
-        # Simple position sizing - use 20% of available capital
-        available_capital = self.portfolio.cash_balance
-        position_value = available_capital * 0.2
-        
-        # Get current price estimate
-        current_price = signal.price_target  # Use target as estimate
-        
-        # Calculate shares
-        shares = position_value / current_price
-        
-        # Round down to whole shares
-        return int(shares)
+        # Use 20% of available capital at the target price, rounded down to whole shares
+        return self._size_position(available_capital, signal.price_target)
     
-    async def _monitor_positions(self):
+    async def _monitor_positions(self, quotes: Dict[str, MarketData], now: datetime):
         """Monitor existing positions for profit taking or stop loss."""
         try:
-            for position in self.portfolio.positions[:]:  # Copy list to avoid modification during iteration
-                # Get current market data
-                market_data = await self.market_data.get_real_time_price(position.symbol)
-                if not market_data:
-                    continue
-                
-                # Update position
-                position.current_price = market_data.price
-                position.market_value = position.quantity * market_data.price
-                position.unrealized_pnl = (market_data.price - position.average_price) * position.quantity
-                position.last_updated = datetime.now()
+            positions = [position for position in self.portfolio.positions.values() if position.symbol in quotes]
+            if not positions:
+                return
+            
+            count = len(positions)
+            avg_prices = np.fromiter((position.average_price for position in positions), dtype=np.float64, count=count)
+            prices = np.fromiter((quotes[position.symbol].price for position in positions), dtype=np.float64, count=count)
+            
+            # Widen the float thresholds slightly so no exact-threshold hit is missed
+            stops, targets = compute_triggers(
+                avg_prices,
+                prices,
+                _STOP_LOSS_FLOAT * (1 + _TRIGGER_TOLERANCE),
+                _PROFIT_TARGET_FLOAT * (1 - _TRIGGER_TOLERANCE)
+            )
+            
+            to_close = []
+            for i in np.flatnonzero(stops | targets):
+                position = positions[i]
+                price = to_decimal(quotes[position.symbol].price)
                 
                 # Check stop loss (2% loss)
-                stop_loss_price = position.average_price * 0.98
-                if market_data.price <= stop_loss_price:
-                    logger.info(f"Stop loss triggered for {position.symbol}")
-                    await self._close_position(position, "Stop loss")
+                if price <= position.average_price * STOP_LOSS_MULTIPLIER:
+                    logger.info("Stop loss triggered for {}", position.symbol)
+                    to_close.append((position, "Stop loss"))
                 
                 # Check profit target (5% gain)
-                profit_target_price = position.average_price * 1.05
-                if market_data.price >= profit_target_price:
-                    logger.info(f"Profit target reached for {position.symbol}")
-                    await self._close_position(position, "Profit target")
+                elif price >= position.average_price * PROFIT_TARGET_MULTIPLIER:
+                    logger.info("Profit target reached for {}", position.symbol)
+                    to_close.append((position, "Profit target"))
+            
+            if to_close:
+                await self._close_positions(to_close, now)
                 
         except Exception as e:
             logger.error(f"Error monitoring positions: {e}")
     
-    async def _close_position(self, position: Position, reason: str):
-        """Close a position."""
+    async def _close_positions(self, to_close: List[Tuple[Position, str]], now: datetime):
+        """Close positions with one batch of SELL orders."""
         try:
-            trade = Trade(
-                symbol=position.symbol,
-                order_type="SELL",
-                quantity=position.quantity,
-                price=position.current_price,
-                timestamp=datetime.now(),
-                notes=f"Closing position: {reason}"
-            )
+            trades = [
+                Trade(
+                    symbol=position.symbol,
+                    order_type=OrderType.SELL,
+                    quantity=position.quantity,
+                    price=position.current_price,
+                    timestamp=now,
+                    notes=f"Closing position: {reason}"
+                )
+                for position, reason in to_close
+            ]
             
-            success = await self._execute_trade(trade)
-            if success:
-                logger.info(f"Closed position in {position.symbol}: {reason}")
-            else:
-                logger.error(f"Failed to close position in {position.symbol}")
+            await self._execute_trades(trades)
+            for trade, (position, reason) in zip(trades, to_close):
+                if trade.status == OrderStatus.FILLED:
+                    logger.info("Closed position in {}: {}", position.symbol, reason)
+                else:
+                    logger.error("Failed to close position in {}", position.symbol)
                 
         except Exception as e:
-            logger.error(f"Error closing position: {e}")
+            logger.error(f"Error closing positions: {e}")
     
     async def _close_all_positions(self):
         """Close all open positions."""
         logger.info("Closing all positions...")
         
-        for position in self.portfolio.positions[:]:
-            await self._close_position(position, "Bot shutdown")
+        to_close = [(position, "Bot shutdown") for position in self.portfolio.positions.values()]
+        if to_close:
+            await self._close_positions(to_close, datetime.now())
     
-    async def _update_portfolio(self):
-        """Update portfolio values and P&L."""
+    def _update_portfolio(self, quotes: Dict[str, MarketData], now: datetime):
+        """Update portfolio values and P&L from the current tick's quotes."""
         try:
             total_value = self.portfolio.cash_balance
             
-            for position in self.portfolio.positions:
-                # Get current price
-                market_data = await self.market_data.get_real_time_price(position.symbol)
+            for position in self.portfolio.positions.values():
+                market_data = quotes.get(position.symbol)
                 if market_data:
-                    position.current_price = market_data.price
-                    position.market_value = position.quantity * market_data.price
-                    position.unrealized_pnl = (market_data.price - position.average_price) * position.quantity
+                    price = to_decimal(market_data.price)
+                    position.current_price = price
+                    position.market_value = position.quantity * price
+                    position.unrealized_pnl = (price - position.average_price) * position.quantity
+                    position.last_updated = now
                 
                 total_value += position.market_value
             
@@ -362,7 +519,7 @@ class NVSTWZBot:
             self.portfolio.daily_pnl = self.daily_pnl
             self.portfolio.total_return = (self.total_pnl / self.initial_capital) * 100
             self.portfolio.daily_return = (self.daily_pnl / self.daily_start_value) * 100
-            self.portfolio.last_updated = datetime.now()
+            self.portfolio.last_updated = now
             
             self.current_capital = total_value
             
@@ -372,31 +529,29 @@ class NVSTWZBot:
     def _check_risk_limits(self) -> bool:
         """Check if we're within risk limits."""
         # Check daily loss limit
-        if self.daily_pnl < -self.initial_capital * config.trading.max_daily_loss:
+        if self.daily_pnl < self._daily_loss_limit:
             logger.warning("Daily loss limit exceeded")
             return False
         
         # Check total loss limit
-        if self.total_pnl < -self.initial_capital * 0.5:  # 50% total loss limit
+        if self.total_pnl < self._total_loss_limit:
             logger.warning("Total loss limit exceeded")
             return False
         
         return True
     
-    def _reset_daily_counters(self):
+    def _reset_daily_counters(self, now: datetime):
         """Reset daily counters if it's a new day."""
-        today = datetime.now().date()
+        today = now.date()
         if today > self.last_reset_date:
             self.daily_trades = 0
             self.daily_start_value = self.current_capital
-            self.daily_pnl = 0.0
+            self.daily_pnl = ZERO
             self.last_reset_date = today
             logger.info("Daily counters reset")
     
-    async def _log_status(self):
+    def _log_status(self):
         """Log current bot status."""
-        self.last_heartbeat = datetime.now()
-        
         status = BotStatus(
             is_running=self.is_running,
             last_heartbeat=self.last_heartbeat,
@@ -404,12 +559,15 @@ class NVSTWZBot:
             daily_trades=self.daily_trades,
             current_capital=self.current_capital,
             daily_pnl=self.daily_pnl,
-            errors=self.errors[-5:],  # Last 5 errors
-            warnings=self.warnings[-5:]  # Last 5 warnings
+            errors=list(self.errors)[-5:],  # Last 5 errors
+            warnings=list(self.warnings)[-5:]  # Last 5 warnings
         )
         
-        logger.info(f"Bot Status - Capital: ${self.current_capital:.2f}, Daily P&L: ${self.daily_pnl:.2f}, "
-                   f"Daily Trades: {self.daily_trades}, Active Positions: {len(self.portfolio.positions)}")
+        # Arguments are only formatted if a sink accepts INFO
+        logger.info(
+            "Bot Status - Capital: ${:.2f}, Daily P&L: ${:.2f}, Daily Trades: {}, Active Positions: {}",
+            self.current_capital, self.daily_pnl, self.daily_trades, len(self.portfolio.positions)
+        )
     
     def get_status(self) -> BotStatus:
         """Get current bot status."""
@@ -420,6 +578,6 @@ class NVSTWZBot:
             daily_trades=self.daily_trades,
             current_capital=self.current_capital,
             daily_pnl=self.daily_pnl,
-            errors=self.errors[-5:],
-            warnings=self.warnings[-5:]
+            errors=list(self.errors)[-5:],
+            warnings=list(self.warnings)[-5:]
         ) 
\ No newline at end of file
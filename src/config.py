@@ -2,6 +2,7 @@
 Configuration management for NVSTWZ investment bot.
 """
 import os
+from dataclasses import make_dataclass
 from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
@@ -48,14 +49,28 @@ class LoggingConfig(BaseSettings):
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
     log_file: str = Field(default="logs/nvstwz.log", env="LOG_FILE")
 
+def _freeze(settings: BaseSettings):
+    """Copy parsed settings into a frozen, slotted dataclass for plain attribute reads."""
+    settings_cls = type(settings)
+    frozen_cls = make_dataclass(
+        f"Frozen{settings_cls.__name__}",
+        [(name, field.annotation) for name, field in settings_cls.model_fields.items()],
+        frozen=True,
+        slots=True
+    )
+    return frozen_cls(**settings.model_dump())
+
 class Config:
     """Main configuration class."""
+    __slots__ = ("trading", "api", "database", "redis", "logging")
+    
     def __init__(self):
-        self.trading = TradingConfig()
-        self.api = APIConfig()
-        self.database = DatabaseConfig()
-        self.redis = RedisConfig()
-        self.logging = LoggingConfig()
+        # Parse and validate with pydantic once, then keep read-only snapshots
+        self.trading = _freeze(TradingConfig())
+        self.api = _freeze(APIConfig())
+        self.database = _freeze(DatabaseConfig())
+        self.redis = _freeze(RedisConfig())
+        self.logging = _freeze(LoggingConfig())
     
     def validate(self) -> bool:
         """Validate that all required configuration is present."""
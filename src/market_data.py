@@ -3,19 +3,22 @@ Market Data Engine for NVSTWZ investment bot.
 Simulation mode for testing without external API dependencies.
 """
 import asyncio
-import random
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Collection, AsyncIterator
+import numpy as np
 from loguru import logger
 from .models import MarketData, NewsEvent, MarketSentiment
 from .config import config
+from .utils.cache import TTLCache
 
 class MarketDataEngine:
     """Market data engine in simulation mode for testing."""
     
     def __init__(self):
-        self.cache = {}
         self.cache_duration = 60  # 1 minute cache
+        self.cache = TTLCache(maxsize=1024, ttl_seconds=self.cache_duration, max_reads=50)  # 1 minute or 50 reads
+        self.max_concurrent_requests = 10  # Per-symbol burst ceiling (Finnhub free tier)
+        self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
         self.base_prices = {
             'AAPL': 150.0,
             'MSFT': 300.0,
@@ -25,75 +28,98 @@ class MarketDataEngine:
             'META': 350.0,
             'NVDA': 500.0
         }
-        self.price_history = {symbol: [price] for symbol, price in self.base_prices.items()}
+        self._rng = np.random.default_rng()
         
-    def _simulate_price_movement(self, symbol: str) -> tuple:
-        """Simulate realistic price movement."""
-        base_price = self.base_prices[symbol]
+        # Price history as one ring buffer row per symbol, keeping only the last 100 prices
+        self.history_length = 100
+        self._sym_idx = {symbol: i for i, symbol in enumerate(self.base_prices)}
+        self._base = np.array(list(self.base_prices.values()))
+        self._prices = np.empty((len(self._base), self.history_length))
+        self._prices[:, 0] = self._base
+        self._head = np.ones(len(self._base), dtype=np.int64)  # One past the latest price in each row
+        self._count = np.ones(len(self._base), dtype=np.int64)
         
-        # Get recent price history
-        if symbol in self.price_history and len(self.price_history[symbol]) > 0:
-            current_price = self.price_history[symbol][-1]
-        else:
-            current_price = base_price
+    def _simulate_price_movements(self, symbols: List[str]) -> tuple:
+        """Simulate realistic price movements for several symbols at once."""
+        idx = np.fromiter((self._sym_idx[symbol] for symbol in symbols), dtype=np.int64, count=len(symbols))
+        heads = self._head[idx]
+        base_prices = self._base[idx]
+        current_prices = self._prices[idx, heads - 1]
         
         # Simulate price movement (random walk with some trend)
         volatility = 0.02  # 2% daily volatility
-        trend = random.uniform(-0.01, 0.01)  # Slight trend
+        trends = self._rng.uniform(-0.01, 0.01, len(symbols))  # Slight trend
         
-        # Calculate new price
-        change_pct = random.gauss(trend, volatility)
-        new_price = current_price * (1 + change_pct)
+        # Calculate new prices
+        change_pcts = self._rng.normal(trends, volatility)
+        new_prices = current_prices * (1 + change_pcts)
         
-        # Ensure price doesn't go negative
-        new_price = max(new_price, base_price * 0.5)
+        # Ensure prices don't go negative
+        new_prices = np.maximum(new_prices, base_prices * 0.5)
         
         # Update price history
-        if symbol not in self.price_history:
-            self.price_history[symbol] = []
-        self.price_history[symbol].append(new_price)
+        self._prices[idx, heads % self.history_length] = new_prices
+        self._head[idx] = heads % self.history_length + 1
+        self._count[idx] = np.minimum(self._count[idx] + 1, self.history_length)
         
-        # Keep only last 100 prices
-        if len(self.price_history[symbol]) > 100:
-            self.price_history[symbol] = self.price_history[symbol][-100:]
+        # Calculate changes
+        price_changes = new_prices - current_prices
+        price_change_pcts = (price_changes / current_prices) * 100
         
-        # Calculate change
-        price_change = new_price - current_price
-        price_change_pct = (price_change / current_price) * 100
+        return new_prices, price_changes, price_change_pcts
+    
+    def get_price_history(self, symbol: str) -> np.ndarray:
+        """Return a symbol's recent simulated prices, oldest first."""
+        i = self._sym_idx.get(symbol)
+        if i is None:
+            return np.empty(0)
         
-        return new_price, price_change, price_change_pct
+        head = self._head[i]
+        return self._prices[i].take(np.arange(head - self._count[i], head), mode='wrap')
     
-    async def get_real_time_price(self, symbol: str) -> Optional[MarketData]:
-        """Get simulated real-time price data."""
-        try:
-            # Check cache first
-            cache_key = f"price_{symbol}"
-            if cache_key in self.cache:
-                cached_data, timestamp = self.cache[cache_key]
-                if (datetime.now() - timestamp).seconds < self.cache_duration:
-                    logger.debug(f"Using cached data for {symbol}")
-                    return cached_data
-            
-            # Simulate a small delay
-            await asyncio.sleep(0.1)
-            
-            logger.info(f"Fetching price for {symbol}")
-            
-            # Simulate price movement
-            current_price, price_change, price_change_pct = self._simulate_price_movement(symbol)
-            
-            # Simulate volume
-            volume = random.randint(1000000, 10000000)
-            
-            # Calculate additional required fields
-            high = current_price * (1 + random.uniform(0, 0.05))
-            low = current_price * (1 - random.uniform(0, 0.05))
-            open_price = current_price * (1 + random.uniform(-0.02, 0.02))
-            previous_close = current_price - price_change
-            
+    def _get_cached_price(self, symbol: str) -> Optional[MarketData]:
+        """Return cached price data for a symbol if it is still fresh."""
+        cached_data = self.cache.get(symbol)
+        if cached_data:
+            logger.debug(f"Using cached data for {symbol}")
+        return cached_data
+    
+    def _build_market_data(self, symbols: List[str]) -> Dict[str, MarketData]:
+        """Simulate quotes for several symbols in one vectorized pass and cache them."""
+        known = []
+        for symbol in symbols:
+            if symbol in self.base_prices:
+                known.append(symbol)
+            else:
+                logger.error(f"No simulated price data for {symbol}")
+        
+        if not known:
+            return {}
+        
+        # Simulate price movement
+        count = len(known)
+        prices, price_changes, price_change_pcts = self._simulate_price_movements(known)
+        
+        # Simulate volume
+        volumes = self._rng.integers(1000000, 10000000, count, endpoint=True)
+        
+        # Calculate additional required fields
+        highs = prices * (1 + self._rng.uniform(0, 0.05, count))
+        lows = prices * (1 - self._rng.uniform(0, 0.05, count))
+        opens = prices * (1 + self._rng.uniform(-0.02, 0.02, count))
+        previous_closes = prices - price_changes
+        market_caps = prices * volumes * 0.1  # Rough estimate
+        pe_ratios = self._rng.uniform(15, 30, count)
+        
+        timestamp = datetime.now()
+        columns = (prices, volumes, highs, lows, opens, previous_closes, price_changes, price_change_pcts, market_caps, pe_ratios)
+        
+        results = {}
+        for symbol, row in zip(known, zip(*(column.tolist() for column in columns))):
+            price, volume, high, low, open_price, previous_close, price_change, price_change_pct, market_cap, pe_ratio = row
             market_data = MarketData(
                 symbol=symbol,
-                price=current_price,
+                price=price,
                 volume=volume,
                 high=high,
                 low=low,
@@ -101,34 +127,93 @@ class MarketDataEngine:
                 previous_close=previous_close,
                 change=price_change,
                 change_percent=price_change_pct,
-                timestamp=datetime.now(),
-                market_cap=current_price * volume * 0.1,  # Rough estimate
-                pe_ratio=random.uniform(15, 30)
+                timestamp=timestamp,
+                market_cap=market_cap,
+                pe_ratio=pe_ratio
             )
             
             # Cache the result
-            self.cache[cache_key] = (market_data, datetime.now())
+            self.cache.set(symbol, market_data)
+            results[symbol] = market_data
+            
+            logger.info(f"Successfully fetched {symbol}: ${price:.2f} ({price_change_pct:+.2f}%)")
+        
+        return results
+    
+    async def get_real_time_price(self, symbol: str, force_refresh: bool = False) -> Optional[MarketData]:
+        """Get simulated real-time price data."""
+        try:
+            # Check cache first
+            cached_data = None if force_refresh else self._get_cached_price(symbol)
+            if cached_data:
+                return cached_data
             
-            logger.info(f"Successfully fetched {symbol}: ${current_price:.2f} ({price_change_pct:+.2f}%)")
-            return market_data
+            async with self._request_semaphore:
+                # Simulate a small delay
+                await asyncio.sleep(0.1)
+                
+                logger.info(f"Fetching price for {symbol}")
+                return self._build_market_data([symbol]).get(symbol)
             
         except Exception as e:
             logger.error(f"Error in get_real_time_price for {symbol}: {e}")
             return None
     
+    async def get_real_time_prices(self, symbols: List[str], force_refresh: bool = False) -> Dict[str, MarketData]:
+        """Get simulated real-time prices for several symbols in one bulk request."""
+        results = {}
+        missing = []
+        
+        for symbol in dict.fromkeys(symbols):
+            cached_data = None if force_refresh else self._get_cached_price(symbol)
+            if cached_data:
+                results[symbol] = cached_data
+            else:
+                missing.append(symbol)
+        
+        if not missing:
+            return results
+        
+        try:
+            results.update(await self._fetch_bulk_prices(missing))
+            return results
+        except Exception as e:
+            logger.warning(f"Bulk price request failed, fetching symbols individually: {e}")
+        
+        # Fall back to concurrent per-symbol requests
+        fetched = await asyncio.gather(
+            *(self.get_real_time_price(symbol, force_refresh=True) for symbol in missing),
+            return_exceptions=True
+        )
+        for symbol, data in zip(missing, fetched):
+            if isinstance(data, MarketData):
+                results[symbol] = data
+        
+        return results
+    
+    async def _fetch_bulk_prices(self, symbols: List[str]) -> Dict[str, MarketData]:
+        """Simulate a single bulk quote request for uncached symbols."""
+        # One simulated delay for the whole batch
+        await asyncio.sleep(0.1)
+        
+        logger.info(f"Fetching prices for {', '.join(symbols)}")
+        return self._build_market_data(symbols)
+    
+    async def stream_prices(self, symbols: Collection[str], interval: float) -> AsyncIterator[Dict[str, MarketData]]:
+        """Yield fresh prices for the live set of subscribed symbols on every update."""
+        while True:
+            yield await self.get_real_time_prices(list(symbols), force_refresh=True)
+            await asyncio.sleep(interval)
+    
     async def get_top_movers(self, limit: int = 3) -> List[MarketData]:
         """Get top moving stocks."""
         try:
             # Use a small list for testing
             major_stocks = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'META', 'NVDA']
             
-            results = []
-            
-            # Process all symbols
-            for symbol in major_stocks[:limit]:
-                data = await self.get_real_time_price(symbol)
-                if data:
-                    results.append(data)
+            # Fetch all symbols in one bulk request
+            symbols = major_stocks[:limit]
+            results = list((await self.get_real_time_prices(symbols)).values())
             
             # Sort by absolute price change percentage
             results.sort(key=lambda x: abs(x.change_percent), reverse=True)
@@ -146,28 +231,35 @@ class MarketDataEngine:
         news_events = []
         
         if symbols:
-            for symbol in symbols[:3]:  # Limit to 3 symbols
-                # Simulate news based on price movement
-                data = await self.get_real_time_price(symbol)
-                if data and abs(data.change_percent) > 1:
-                    sentiment = "bullish" if data.change_percent > 0 else "bearish"
-                    
-                    news_event = NewsEvent(
-                        title=f"{symbol} shows {'strong' if abs(data.change_percent) > 3 else 'moderate'} movement",
-                        description=f"{symbol} is trading at ${data.price:.2f} with {data.change_percent:+.2f}% change",
-                        source="Simulated News",
-                        url="",
-                        published_at=datetime.now(),
-                        sentiment=sentiment,
-                        confidence=0.7,
-                        symbols=[symbol],
-                        impact_score=min(0.9, abs(data.change_percent) / 10)
-                    )
-                    news_events.append(news_event)
+            # Fresh cached quotes are read directly; only misses go out, in one bulk request
+            quotes = await self.get_real_time_prices(symbols[:3])  # Limit to 3 symbols
+            now = datetime.now()
+            
+            # Simulate news based on price movement
+            for data in quotes.values():
+                if abs(data.change_percent) > 1:
+                    news_events.append(self._simulate_news_event(data, now))
         
         logger.info(f"Generated {len(news_events)} simulated news events")
         return news_events
     
+    def _simulate_news_event(self, data: MarketData, now: datetime) -> NewsEvent:
+        """Simulate a news event for a quote's price movement."""
+        symbol = data.symbol
+        sentiment = MarketSentiment.BULLISH if data.change_percent > 0 else MarketSentiment.BEARISH
+        
+        return NewsEvent(
+            title=f"{symbol} shows {'strong' if abs(data.change_percent) > 3 else 'moderate'} movement",
+            description=f"{symbol} is trading at ${data.price:.2f} with {data.change_percent:+.2f}% change",
+            source="Simulated News",
+            url="",
+            published_at=now,
+            sentiment=sentiment,
+            confidence=0.7,
+            symbols=[symbol],
+            impact_score=min(0.9, abs(data.change_percent) / 10)
+        )
+    
     async def get_market_sentiment(self, symbol: str) -> MarketSentiment:
         """Get market sentiment for a symbol based on price movement."""
         try:
@@ -198,12 +290,12 @@ class MarketDataEngine:
             return MarketSentiment(symbol=symbol, sentiment="neutral", confidence=0.5)
     
     def _deduplicate_news(self, news_events: List[NewsEvent]) -> List[NewsEvent]:
-        """Remove duplicate news events."""
+        """Remove duplicate news events published under the same title in the same clock minute."""
         seen = set()
         unique_news = []
         
         for event in news_events:
-            key = f"{event.title}_{event.timestamp}"
+            key = (event.title, event.published_at.replace(second=0, microsecond=0))
             if key not in seen:
                 seen.add(key)
                 unique_news.append(event)
@@ -1,8 +1,10 @@
 """
 Data models for NVSTWZ investment bot.
 """
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
+from decimal import Decimal
+from typing import Optional, List, Dict
 from pydantic import BaseModel, Field
 from enum import Enum
 
@@ -39,27 +41,29 @@ class Trade(BaseModel):
     id: Optional[int] = None
     symbol: str
     order_type: OrderType
-    quantity: float
-    price: float
+    quantity: Decimal
+    price: Decimal
     timestamp: datetime
     status: OrderStatus = OrderStatus.PENDING
     order_id: Optional[str] = None
-    commission: float = 0.0
+    commission: Decimal = Decimal("0")
     notes: Optional[str] = None
 
-class Position(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Position:
     """Portfolio position model."""
     id: Optional[int] = None
     symbol: str
-    quantity: float
-    average_price: float
-    current_price: float
-    market_value: float
-    unrealized_pnl: float
-    realized_pnl: float
+    quantity: Decimal
+    average_price: Decimal
+    current_price: Decimal
+    market_value: Decimal
+    unrealized_pnl: Decimal
+    realized_pnl: Decimal
     last_updated: datetime
 
-class MarketData(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class MarketData:
     """Market data model."""
     symbol: str
     price: float
@@ -74,7 +78,8 @@ class MarketData(BaseModel):
     market_cap: Optional[float] = None
     pe_ratio: Optional[float] = None
 
-class NewsEvent(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class NewsEvent:
     """News event model."""
     id: Optional[int] = None
     title: str
@@ -84,21 +89,26 @@ class NewsEvent(BaseModel):
     published_at: datetime
     sentiment: MarketSentiment
     confidence: float
-    symbols: List[str] = []
+    symbols: List[str] = field(default_factory=list)
     impact_score: float = 0.0
+    published_ts: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # POSIX publish time, computed once for recency math
+        object.__setattr__(self, "published_ts", self.published_at.timestamp())
 
 class Portfolio(BaseModel):
     """Portfolio model."""
     id: Optional[int] = None
-    total_value: float
-    cash_balance: float
-    invested_amount: float
-    daily_pnl: float
-    total_pnl: float
-    daily_return: float
-    total_return: float
+    total_value: Decimal
+    cash_balance: Decimal
+    invested_amount: Decimal
+    daily_pnl: Decimal
+    total_pnl: Decimal
+    daily_return: Decimal
+    total_return: Decimal
     last_updated: datetime
-    positions: List[Position] = []
+    positions: Dict[str, Position] = {}
 
 class TradingSignal(BaseModel):
     """Trading signal model."""
@@ -131,7 +141,7 @@ class BotStatus(BaseModel):
     last_heartbeat: datetime
     active_trades: int
     daily_trades: int
-    current_capital: float
-    daily_pnl: float
+    current_capital: Decimal
+    daily_pnl: Decimal
     errors: List[str] = []
     warnings: List[str] = [] 
\ No newline at end of file
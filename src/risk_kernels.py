@@ -0,0 +1,13 @@
+"""
+Numeric risk kernels for NVSTWZ position monitoring.
+"""
+import numpy as np
+
+from .utils._njit import njit
+
+@njit(cache=True, fastmath=True)
+def compute_triggers(avg_prices: np.ndarray, prices: np.ndarray, stop_mult: float, target_mult: float):
+    """Return (stop_mask, target_mask) for positions against their average prices."""
+    stops = prices <= avg_prices * stop_mult
+    targets = prices >= avg_prices * target_mult
+    return stops, targets
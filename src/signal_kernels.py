@@ -0,0 +1,24 @@
+"""
+Numeric signal kernels for NVSTWZ strategy scoring.
+"""
+import numpy as np
+
+from .utils._njit import njit
+
+@njit(cache=True, fastmath=True)
+def momentum_kernel(change_pcts: np.ndarray, volumes: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+                    opens: np.ndarray, prices: np.ndarray, threshold_pct: float, min_volume: float,
+                    min_confidence: float, stop_loss: float):
+    """Return (mask, scores, price_targets, stop_losses) for momentum signals over a batch of quotes."""
+    # Momentum score from price change, volume and intraday volatility, each normalized to 0-1
+    base_scores = np.minimum(np.abs(change_pcts) / 10, 1.0)
+    volume_factors = np.minimum(volumes / 10000000, 1.0)
+    volatility_factors = np.minimum((highs - lows) / opens * 10, 1.0)
+    scores = np.minimum(base_scores * 0.5 + volume_factors * 0.3 + volatility_factors * 0.2, 1.0)
+    
+    # Large enough moves on liquid stocks with a confident score
+    mask = (np.abs(change_pcts) >= threshold_pct) & (volumes >= min_volume) & (scores > min_confidence)
+    
+    price_targets = prices * (1 + (change_pcts / 100) * 0.5)
+    stop_losses = prices * (1 - stop_loss)
+    return mask, scores, price_targets, stop_losses
\ No newline at end of file
@@ -2,19 +2,52 @@
 Strategy engine for generating trading signals and making investment decisions.
 """
 import asyncio
+import heapq
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Collection, Iterator
 import pandas as pd
 import numpy as np
 from dataclasses import dataclass
+from operator import attrgetter
 
 from .models import TradingSignal, OrderType, MarketData, NewsEvent, MarketSentiment
 from .market_data import MarketDataEngine
+from .signal_kernels import momentum_kernel
 from .utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-@dataclass
+# News sources trusted enough to raise signal confidence
+_CREDIBLE_SOURCES = frozenset({'Reuters', 'Bloomberg', 'CNBC', 'MarketWatch'})
+
+# Enum members are singletons, so sentiments compare by identity
+_BULL = MarketSentiment.BULLISH
+_BEAR = MarketSentiment.BEARISH
+
+def _rsi(closes: np.ndarray, period: int = 14) -> float:
+    """Calculate the latest Wilder RSI over a close series."""
+    if len(closes) <= period:
+        return 50.0  # Not enough history, neutral
+    
+    deltas = pd.Series(np.diff(closes))
+    avg_gain = deltas.clip(lower=0).ewm(alpha=1 / period, adjust=False).mean().iloc[-1]
+    avg_loss = (-deltas.clip(upper=0)).ewm(alpha=1 / period, adjust=False).mean().iloc[-1]
+    if avg_loss == 0:
+        return 100.0 if avg_gain > 0 else 50.0
+    
+    return float(100 - 100 / (1 + avg_gain / avg_loss))
+
+def _macd(closes: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> float:
+    """Calculate the latest MACD histogram (MACD line minus signal line) over a close series."""
+    if len(closes) < 2:
+        return 0.0
+    
+    series = pd.Series(closes)
+    macd_line = series.ewm(span=fast, adjust=False).mean() - series.ewm(span=slow, adjust=False).mean()
+    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+    return float(macd_line.iloc[-1] - signal_line.iloc[-1])
+
+@dataclass(frozen=True, slots=True)
 class StrategyConfig:
     """Configuration for trading strategy."""
     min_confidence: float = 0.7
@@ -30,18 +63,19 @@ class StrategyEngine:
     
     def __init__(self, market_data_engine: MarketDataEngine):
         self.market_data = market_data_engine
-        self.config = StrategyConfig()
         # Override max_daily_trades from global config
         from .config import config
-        self.config.max_daily_trades = config.trading.max_daily_trades
+        self.config = StrategyConfig(max_daily_trades=config.trading.max_daily_trades)
         self.daily_trades = 0
         self.last_reset = datetime.now().date()
     
-    async def generate_signals(self, current_positions: List[str] = None) -> List[TradingSignal]:
+    async def generate_signals(self, current_positions: Collection[str] = None) -> List[TradingSignal]:
         """Generate trading signals based on market analysis."""
         try:
+            now = datetime.now()
+            
             # Reset daily trade counter if it's a new day
-            self._reset_daily_counter()
+            self._reset_daily_counter(now)
             
             if self.daily_trades >= self.config.max_daily_trades:
                 logger.info("Maximum daily trades reached")
@@ -49,286 +83,289 @@ class StrategyEngine:
             
             signals = []
             
-            # Get market data - very limited for testing
-            top_movers = await self.market_data.get_top_movers(limit=3)
-            news_events = await self.market_data.get_market_news(hours_back=6)
+            # Get market data concurrently - very limited for testing
+            top_movers, news_events = await asyncio.gather(
+                self.market_data.get_top_movers(limit=3),
+                self.market_data.get_market_news(hours_back=6)
+            )
+            
+            # Quotes fetched during this pass, shared across generators
+            quotes = {data.symbol: data for data in top_movers}
             
-            # Generate signals based on different strategies
-            momentum_signals = await self._generate_momentum_signals(top_movers)
-            news_signals = await self._generate_news_signals(news_events)
-            technical_signals = await self._generate_technical_signals(top_movers)
+            # Snapshot price histories here; the news pass may tick the engine while scoring runs
+            histories = [self.market_data.get_price_history(data.symbol) for data in top_movers]
+            
+            # Generate signals based on different strategies, scoring off the event loop
+            momentum_signals, news_signals, technical_signals = await asyncio.gather(
+                asyncio.to_thread(self._momentum_sync, top_movers, now),
+                self._generate_news_signals(news_events, now, quotes),
+                asyncio.to_thread(self._technical_sync, top_movers, histories, now)
+            )
             
             # Combine and filter signals
             all_signals = momentum_signals + news_signals + technical_signals
             filtered_signals = self._filter_signals(all_signals, current_positions)
             
-            # Sort by confidence and return top signals
-            sorted_signals = sorted(filtered_signals, key=lambda x: x.confidence, reverse=True)
-            
-            # Limit number of signals based on remaining daily trades
-            max_signals = min(len(sorted_signals), self.config.max_daily_trades - self.daily_trades)
-            return sorted_signals[:max_signals]
+            # Return the most confident signals, limited by remaining daily trades
+            max_signals = self.config.max_daily_trades - self.daily_trades
+            return heapq.nlargest(max_signals, filtered_signals, key=attrgetter('confidence'))
             
         except Exception as e:
             logger.error(f"Error generating signals: {e}")
             return []
     
-    async def _generate_momentum_signals(self, market_data: List[MarketData]) -> List[TradingSignal]:
-        """Generate signals based on price momentum."""
-        signals = []
+    def _momentum_sync(self, market_data: List[MarketData], now: datetime) -> List[TradingSignal]:
+        """Generate signals based on price momentum (CPU-bound, run in a worker thread)."""
+        if not market_data:
+            return []
         
-        for data in market_data:
-            if abs(data.change_percent) < self.config.momentum_threshold * 100:
-                continue
-            
-            if data.volume < self.config.min_volume:
-                continue
-            
-            # Calculate momentum score
-            momentum_score = self._calculate_momentum_score(data)
+        # Columns of the quotes as NumPy arrays
+        count = len(market_data)
+        change_pcts = np.fromiter((data.change_percent for data in market_data), dtype=np.float64, count=count)
+        volumes = np.fromiter((data.volume for data in market_data), dtype=np.float64, count=count)
+        highs = np.fromiter((data.high for data in market_data), dtype=np.float64, count=count)
+        lows = np.fromiter((data.low for data in market_data), dtype=np.float64, count=count)
+        opens = np.fromiter((data.open for data in market_data), dtype=np.float64, count=count)
+        prices = np.fromiter((data.price for data in market_data), dtype=np.float64, count=count)
+        
+        # Score, filter and price all movers in one compiled pass
+        mask, momentum_scores, price_targets, stop_losses = momentum_kernel(
+            change_pcts, volumes, highs, lows, opens, prices,
+            self.config.momentum_threshold * 100, float(self.config.min_volume),
+            self.config.min_confidence, self.config.stop_loss
+        )
+        
+        # One slot per masked row, filled in place
+        indices = np.flatnonzero(mask)
+        signals = [None] * len(indices)
+        
+        for n, i in enumerate(indices):
+            data = market_data[i]
+            momentum_score = float(momentum_scores[i])
+            signal_type = OrderType.BUY if data.change_percent > 0 else OrderType.SELL
             
-            if momentum_score > self.config.min_confidence:
-                signal_type = OrderType.BUY if data.change_percent > 0 else OrderType.SELL
-                
-                signal = TradingSignal(
-                    symbol=data.symbol,
-                    signal_type=signal_type,
-                    confidence=momentum_score,
-                    price_target=data.price * (1 + (data.change_percent / 100) * 0.5),
-                    stop_loss=data.price * (1 - self.config.stop_loss),
-                    reasoning=f"Momentum signal: {data.change_percent:.2f}% change with {data.volume:,} volume",
-                    timestamp=datetime.now(),
-                    technical_indicators={
-                        "momentum_score": momentum_score,
-                        "price_change": data.change_percent,
-                        "volume": data.volume
-                    }
-                )
-                signals.append(signal)
+            signal = TradingSignal(
+                symbol=data.symbol,
+                signal_type=signal_type,
+                confidence=momentum_score,
+                price_target=float(price_targets[i]),
+                stop_loss=float(stop_losses[i]),
+                reasoning=f"Momentum signal: {data.change_percent:.2f}% change with {data.volume:,} volume",
+                timestamp=now,
+                technical_indicators={
+                    "momentum_score": momentum_score,
+                    "price_change": data.change_percent,
+                    "volume": data.volume
+                }
+            )
+            signals[n] = signal
         
         return signals
     
-    async def _generate_news_signals(self, news_events: List[NewsEvent]) -> List[TradingSignal]:
+    async def _generate_news_signals(self, news_events: List[NewsEvent], now: datetime,
+                                     quotes: Dict[str, MarketData]) -> List[TradingSignal]:
         """Generate signals based on news sentiment."""
         signals = []
         
-        for event in news_events:
-            if event.impact_score < 0.7:  # Only high-impact news
-                continue
-            
-            if not event.symbols:  # Skip general market news
-                continue
-            
+        # Only high-impact news about specific symbols; general market news is skipped
+        events = [event for event in news_events if event.impact_score >= 0.7 and event.symbols]
+        if not events:
+            return signals
+        
+        # Get current market data for every mentioned symbol not already quoted this pass
+        await self._get_quotes([symbol for event in events for symbol in event.symbols], quotes)
+        now_ts = now.timestamp()
+        append = signals.append
+        
+        min_confidence = self.config.min_confidence
+        profit_target = self.config.profit_target
+        stop_loss = self.config.stop_loss
+        
+        for event in events:
+            bullish = event.sentiment is _BULL
             for symbol in event.symbols:
-                # Get current market data for the symbol
-                market_data = await self.market_data.get_real_time_price(symbol)
+                market_data = quotes.get(symbol)
                 if not market_data:
                     continue
                 
                 # Calculate news-based confidence
-                confidence = self._calculate_news_confidence(event, market_data)
+                confidence = self._calculate_news_confidence(event, market_data, now_ts)
                 
-                if confidence > self.config.min_confidence:
-                    signal_type = OrderType.BUY if event.sentiment == MarketSentiment.BULLISH else OrderType.SELL
+                if confidence > min_confidence:
+                    signal_type = OrderType.BUY if bullish else OrderType.SELL
                     
                     # Calculate price targets based on sentiment
-                    if event.sentiment == MarketSentiment.BULLISH:
-                        price_target = market_data.price * (1 + self.config.profit_target)
+                    if bullish:
+                        price_target = market_data.price * (1 + profit_target)
                     else:
-                        price_target = market_data.price * (1 - self.config.profit_target)
+                        price_target = market_data.price * (1 - profit_target)
                     
                     signal = TradingSignal(
                         symbol=symbol,
                         signal_type=signal_type,
                         confidence=confidence,
                         price_target=price_target,
-                        stop_loss=market_data.price * (1 - self.config.stop_loss),
+                        stop_loss=market_data.price * (1 - stop_loss),
                         reasoning=f"News signal: {event.title[:50]}...",
-                        timestamp=datetime.now(),
+                        timestamp=now,
                         news_events=[event]
                     )
-                    signals.append(signal)
+                    append(signal)
         
         return signals
     
-    async def _generate_technical_signals(self, market_data: List[MarketData]) -> List[TradingSignal]:
-        """Generate signals based on technical analysis."""
-        signals = []
+    async def _get_quotes(self, symbols: List[str], quotes: Dict[str, MarketData]):
+        """Add quotes for symbols missing from a pass's quotes in one bulk request."""
+        missing = [symbol for symbol in dict.fromkeys(symbols) if symbol not in quotes]
+        if missing:
+            quotes.update(await self.market_data.get_real_time_prices(missing))
+    
+    def _technical_sync(self, market_data: List[MarketData], histories: List[np.ndarray], now: datetime) -> List[TradingSignal]:
+        """Generate signals based on technical analysis (CPU-bound, run in a worker thread)."""
+        if not market_data:
+            return []
         
-        for data in market_data:
-            # Simple technical analysis based on price action
-            technical_score = self._calculate_technical_score(data)
-            
-            if technical_score > self.config.min_confidence:
-                # Determine signal type based on technical indicators
-                signal_type = OrderType.BUY if technical_score > 0.8 else OrderType.SELL
-                
-                signal = TradingSignal(
-                    symbol=data.symbol,
-                    signal_type=signal_type,
-                    confidence=technical_score,
-                    price_target=data.price * (1 + self.config.profit_target),
-                    stop_loss=data.price * (1 - self.config.stop_loss),
-                    reasoning="Technical analysis signal",
-                    timestamp=datetime.now(),
-                    technical_indicators={
-                        "technical_score": technical_score,
-                        "rsi": self._calculate_rsi(data),
-                        "macd": self._calculate_macd(data)
-                    }
-                )
-                signals.append(signal)
+        # Indicators over each symbol's recent price history, computed once
+        count = len(market_data)
+        rsis = np.fromiter((_rsi(closes) for closes in histories), dtype=np.float64, count=count)
+        macds = np.fromiter((_macd(closes) for closes in histories), dtype=np.float64, count=count)
+        change_pcts = np.fromiter((data.change_percent for data in market_data), dtype=np.float64, count=count)
         
-        return signals
-    
-    def _calculate_momentum_score(self, data: MarketData) -> float:
-        """Calculate momentum score for a stock."""
-        # Base score from price change
-        base_score = min(abs(data.change_percent) / 10, 1.0)  # Normalize to 0-1
+        technical_scores = self._calculate_technical_scores(change_pcts, rsis, macds)
         
-        # Volume factor
-        volume_factor = min(data.volume / 10000000, 1.0)  # Normalize volume
+        signals = []
+        append = signals.append
         
-        # Volatility factor
-        volatility = (data.high - data.low) / data.open
-        volatility_factor = min(volatility * 10, 1.0)
+        min_confidence = self.config.min_confidence
+        profit_target = self.config.profit_target
+        stop_loss = self.config.stop_loss
         
-        # Combine factors
-        momentum_score = (base_score * 0.5 + volume_factor * 0.3 + volatility_factor * 0.2)
+        for i in np.flatnonzero(technical_scores > min_confidence):
+            data = market_data[i]
+            technical_score = float(technical_scores[i])
+            
+            # Determine signal type based on technical indicators
+            signal_type = OrderType.BUY if technical_score > 0.8 else OrderType.SELL
+            
+            signal = TradingSignal(
+                symbol=data.symbol,
+                signal_type=signal_type,
+                confidence=technical_score,
+                price_target=data.price * (1 + profit_target),
+                stop_loss=data.price * (1 - stop_loss),
+                reasoning="Technical analysis signal",
+                timestamp=now,
+                technical_indicators={
+                    "technical_score": technical_score,
+                    "rsi": float(rsis[i]),
+                    "macd": float(macds[i])
+                }
+            )
+            append(signal)
         
-        return min(momentum_score, 1.0)
+        return signals
     
-    def _calculate_news_confidence(self, event: NewsEvent, market_data: MarketData) -> float:
+    def _calculate_news_confidence(self, event: NewsEvent, market_data: MarketData, now_ts: float) -> float:
         """Calculate confidence based on news event."""
         # Base confidence from impact score
         base_confidence = event.impact_score
         
         # Sentiment alignment with price action
+        sentiment = event.sentiment
         sentiment_alignment = 0.0
-        if event.sentiment == MarketSentiment.BULLISH and market_data.change_percent > 0:
+        if sentiment is _BULL and market_data.change_percent > 0:
             sentiment_alignment = 0.2
-        elif event.sentiment == MarketSentiment.BEARISH and market_data.change_percent < 0:
+        elif sentiment is _BEAR and market_data.change_percent < 0:
             sentiment_alignment = 0.2
         
         # Recency factor
-        hours_old = (datetime.now() - event.published_at).total_seconds() / 3600
+        hours_old = (now_ts - event.published_ts) / 3600
         recency_factor = max(0, 1 - hours_old / 24)  # Decay over 24 hours
         
         # Source credibility
-        credible_sources = ['Reuters', 'Bloomberg', 'CNBC', 'MarketWatch']
-        credibility_factor = 0.1 if event.source in credible_sources else 0.0
+        credibility_factor = 0.1 if event.source in _CREDIBLE_SOURCES else 0.0
         
         total_confidence = base_confidence + sentiment_alignment + recency_factor + credibility_factor
         return min(total_confidence, 1.0)
     
-    def _calculate_technical_score(self, data: MarketData) -> float:
-        """Calculate technical analysis score."""
-        # Simple technical indicators
-        rsi = self._calculate_rsi(data)
-        macd = self._calculate_macd(data)
-        
-        # RSI signals
-        rsi_score = 0.0
-        if rsi < 30:  # Oversold
-            rsi_score = 0.3
-        elif rsi > 70:  # Overbought
-            rsi_score = 0.3
+    def _calculate_technical_scores(self, change_pcts: np.ndarray, rsis: np.ndarray, macds: np.ndarray) -> np.ndarray:
+        """Calculate technical analysis scores for a batch of stocks."""
+        # RSI signals - oversold or overbought
+        rsi_scores = np.where((rsis < 30) | (rsis > 70), 0.3, 0.0)
         
-        # MACD signals
-        macd_score = 0.0
-        if macd > 0:  # Bullish
-            macd_score = 0.2
-        elif macd < 0:  # Bearish
-            macd_score = 0.2
+        # MACD signals - bullish or bearish
+        macd_scores = np.where(macds != 0, 0.2, 0.0)
         
-        # Price action
-        price_score = 0.0
-        if data.change_percent > 5:  # Strong upward momentum
-            price_score = 0.3
-        elif data.change_percent < -5:  # Strong downward momentum
-            price_score = 0.3
-        
-        return min(rsi_score + macd_score + price_score, 1.0)
-    
-    def _calculate_rsi(self, data: MarketData) -> float:
-        """Calculate RSI (simplified)."""
-        # Simplified RSI calculation
-        if data.previous_close == 0:
-            return 50.0
+        # Price action - strong upward or downward momentum
+        price_scores = np.where(np.abs(change_pcts) > 5, 0.3, 0.0)
         
-        change = data.price - data.previous_close
-        if change > 0:
-            return 60.0  # Bullish
-        else:
-            return 40.0  # Bearish
+        return np.minimum(rsi_scores + macd_scores + price_scores, 1.0)
     
-    def _calculate_macd(self, data: MarketData) -> float:
-        """Calculate MACD (simplified)."""
-        # Simplified MACD calculation
-        if data.previous_close == 0:
-            return 0.0
-        
-        return (data.price - data.previous_close) / data.previous_close
-    
-    def _filter_signals(self, signals: List[TradingSignal], current_positions: List[str] = None) -> List[TradingSignal]:
-        """Filter and rank trading signals."""
-        filtered = []
-        current_positions = current_positions or []
+    def _filter_signals(self, signals: List[TradingSignal], current_positions: Collection[str] = None) -> Iterator[TradingSignal]:
+        """Yield the trading signals that pass the filters."""
+        current_positions = current_positions or ()
         
         for signal in signals:
-            # Skip if already have position in this symbol
-            if signal.symbol in current_positions:
-                continue
-            
             # Skip low confidence signals
             if signal.confidence < self.config.min_confidence:
                 continue
             
+            # Skip if already have position in this symbol
+            if signal.symbol in current_positions:
+                continue
+            
             # Skip signals with extreme price targets
             if signal.price_target > signal.stop_loss * 2:  # Unrealistic profit target
                 continue
             
-            filtered.append(signal)
-        
-        return filtered
+            yield signal
     
-    def _reset_daily_counter(self):
+    def _reset_daily_counter(self, now: datetime):
         """Reset daily trade counter if it's a new day."""
-        today = datetime.now().date()
+        today = now.date()
         if today > self.last_reset:
             self.daily_trades = 0
             self.last_reset = today
     
-    def update_trade_count(self):
+    def update_trade_count(self, count: int = 1):
         """Update the daily trade counter."""
-        self.daily_trades += 1
+        self.daily_trades += count
     
     async def validate_signal(self, signal: TradingSignal) -> bool:
         """Validate a trading signal before execution."""
+        return (await self.validate_signals([signal]))[0]
+    
+    async def validate_signals(self, signals: List[TradingSignal]) -> List[bool]:
+        """Validate trading signals before execution against one batch of quotes."""
         try:
-            # Get current market data
-            market_data = await self.market_data.get_real_time_price(signal.symbol)
-            if not market_data:
-                return False
-            
-            # Check if price is still reasonable
-            current_price = market_data.price
-            if signal.signal_type == OrderType.BUY:
-                if current_price > signal.price_target:
-                    logger.info(f"Price {current_price} exceeds target {signal.price_target} for {signal.symbol}")
-                    return False
-            else:  # SELL
-                if current_price < signal.price_target:
-                    logger.info(f"Price {current_price} below target {signal.price_target} for {signal.symbol}")
-                    return False
-            
-            # Check volume
-            if market_data.volume < self.config.min_volume:
-                logger.info(f"Insufficient volume {market_data.volume} for {signal.symbol}")
-                return False
-            
-            return True
+            # Get current market data for every signal's symbol at once
+            quotes = await self.market_data.get_real_time_prices([signal.symbol for signal in signals])
             
         except Exception as e:
-            logger.error(f"Error validating signal: {e}")
-            return False 
\ No newline at end of file
+            logger.error(f"Error validating signals: {e}")
+            return [False] * len(signals)
+        
+        return [self._check_signal(signal, quotes.get(signal.symbol)) for signal in signals]
+    
+    def _check_signal(self, signal: TradingSignal, market_data: Optional[MarketData]) -> bool:
+        """Check a trading signal against current market data."""
+        if not market_data:
+            return False
+        
+        # Check if price is still reasonable
+        current_price = market_data.price
+        if signal.signal_type == OrderType.BUY:
+            if current_price > signal.price_target:
+                logger.info("Price {} exceeds target {} for {}", current_price, signal.price_target, signal.symbol)
+                return False
+        else:  # SELL
+            if current_price < signal.price_target:
+                logger.info("Price {} below target {} for {}", current_price, signal.price_target, signal.symbol)
+                return False
+        
+        # Check volume
+        if market_data.volume < self.config.min_volume:
+            logger.info("Insufficient volume {} for {}", market_data.volume, signal.symbol)
+            return False
+        
+        return True 
\ No newline at end of file
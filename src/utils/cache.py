@@ -0,0 +1,49 @@
+"""
+Caching utilities for NVSTWZ investment bot.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+class TTLCache:
+    """Size-bounded LRU cache whose entries expire after a fixed TTL or a number of reads."""
+    
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 60, max_reads: Optional[int] = None):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.max_reads = max_reads
+        self._data = OrderedDict()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for a key, or None if missing, expired or read out."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, reads_left, value = entry
+        if reads_left is not None:
+            if reads_left <= 0:
+                del self._data[key]
+                return None
+            entry[1] = reads_left - 1
+        
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entry when full."""
+        self._data[key] = [time.monotonic() + self.ttl_seconds, self.max_reads, value]
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self):
+        """Remove all entries."""
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
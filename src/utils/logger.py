@@ -9,6 +9,10 @@ from pathlib import Path
 
 from ..config import config
 
+# Shared record layouts; the console adds color markup around the same fields
+LOG_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
+CONSOLE_FORMAT = "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+
 def setup_logger():
     """Setup logging configuration."""
     # Remove default logger
@@ -21,29 +25,31 @@ def setup_logger():
     # Console logging
     logger.add(
         sys.stdout,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+        format=CONSOLE_FORMAT,
         level=config.logging.log_level,
         colorize=True
     )
     
-    # File logging
+    # File logging (enqueued so callers never block on disk writes)
     logger.add(
         config.logging.log_file,
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+        format=LOG_FORMAT,
         level="DEBUG",
         rotation="1 day",
         retention="30 days",
-        compression="zip"
+        compression="zip",
+        enqueue=True
     )
     
     # Error logging to separate file
     logger.add(
         "logs/errors.log",
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+        format=LOG_FORMAT,
         level="ERROR",
         rotation="1 day",
         retention="90 days",
-        compression="zip"
+        compression="zip",
+        enqueue=True
     )
 
 def get_logger(name: str):
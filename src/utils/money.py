@@ -0,0 +1,12 @@
+"""
+Money helpers for NVSTWZ investment bot.
+"""
+from decimal import Decimal
+
+ZERO = Decimal("0")
+
+def to_decimal(value) -> Decimal:
+    """Convert a number to Decimal via its string form to avoid binary float artifacts."""
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
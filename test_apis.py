@@ -17,7 +17,7 @@ async def test_alpha_vantage():
         print(f"Testing Alpha Vantage with key: {key[:10]}...")
         
         ts = TimeSeries(key=key, output_format='pandas')
-        data, meta_data = ts.get_quote_endpoint('AAPL')
+        data, meta_data = await asyncio.to_thread(ts.get_quote_endpoint, 'AAPL')
         print(f"✅ Alpha Vantage working! AAPL price: ${data.iloc[0]['05. price']}")
         return True
     except Exception as e:
@@ -32,7 +32,7 @@ async def test_news_api():
         print(f"Testing News API with key: {key[:10]}...")
         
         newsapi = NewsApiClient(api_key=key)
-        news = newsapi.get_everything(q='AAPL', language='en', sort_by='relevancy')
+        news = await asyncio.to_thread(newsapi.get_everything, q='AAPL', language='en', sort_by='relevancy')
         print(f"✅ News API working! Found {len(news['articles'])} articles")
         return True
     except Exception as e:
@@ -47,7 +47,7 @@ async def test_finnhub():
         print(f"Testing Finnhub with key: {key[:10]}...")
         
         finnhub_client = finnhub.Client(api_key=key)
-        quote = finnhub_client.quote('AAPL')
+        quote = await asyncio.to_thread(finnhub_client.quote, 'AAPL')
         print(f"✅ Finnhub working! AAPL price: ${quote['c']}")
         return True
     except Exception as e:
@@ -59,13 +59,16 @@ async def main():
     print("🔍 Testing API Keys...")
     print("=" * 50)
     
-    results = []
-    results.append(await test_alpha_vantage())
-    results.append(await test_news_api())
-    results.append(await test_finnhub())
+    # Probe all APIs concurrently
+    results = await asyncio.gather(
+        test_alpha_vantage(),
+        test_news_api(),
+        test_finnhub(),
+        return_exceptions=True
+    )
     
     print("=" * 50)
-    working_apis = sum(results)
+    working_apis = sum(result is True for result in results)
     print(f"📊 Results: {working_apis}/3 APIs working")
     
     if working_apis >= 2:
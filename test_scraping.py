@@ -17,26 +17,18 @@ async def test_scraping():
     engine = MarketDataEngine()
     
     try:
-        # Test single symbol
-        print("Testing AAPL...")
-        data = await engine.get_real_time_price('AAPL')
-        if data:
-            print(f"✅ AAPL: ${data.price:.2f} ({data.change_percent:+.2f}%)")
-        else:
-            print("❌ Failed to get AAPL data")
-        
-        await asyncio.sleep(3)
-        
-        # Test multiple symbols
-        print("\nTesting multiple symbols...")
-        symbols = ['MSFT', 'GOOGL']
-        for symbol in symbols:
-            data = await engine.get_real_time_price(symbol)
-            if data:
+        # Test symbols concurrently
+        print("Testing AAPL, MSFT and GOOGL...")
+        symbols = ['AAPL', 'MSFT', 'GOOGL']
+        results = await asyncio.gather(
+            *(engine.get_real_time_price(symbol) for symbol in symbols),
+            return_exceptions=True
+        )
+        for symbol, data in zip(symbols, results):
+            if data and not isinstance(data, Exception):
                 print(f"✅ {symbol}: ${data.price:.2f} ({data.change_percent:+.2f}%)")
             else:
                 print(f"❌ Failed to get {symbol} data")
-            await asyncio.sleep(3)
         
         # Test top movers
         print("\nTesting top movers...")
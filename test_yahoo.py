@@ -31,14 +31,13 @@ def test_yahoo():
         # Test 3: Multiple symbols
         print("\nTest 3: Multiple symbols...")
         symbols = ['AAPL', 'MSFT', 'GOOGL']
+        data = yf.download(' '.join(symbols), period='1d', group_by='ticker', threads=True, progress=False)
         for symbol in symbols:
-            print(f"Testing {symbol}...")
-            data = yf.download(symbol, period='1d', progress=False)
-            if not data.empty:
-                print(f"  {symbol}: ${data.iloc[-1]['Close']:.2f}")
+            closes = data[symbol]['Close'].dropna() if symbol in data.columns.get_level_values(0) else None
+            if closes is not None and not closes.empty:
+                print(f"  {symbol}: ${closes.iloc[-1]:.2f}")
             else:
                 print(f"  {symbol}: No data")
-            time.sleep(1)
             
     except Exception as e:
         print(f"Error: {e}")